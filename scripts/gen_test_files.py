@@ -9,174 +9,357 @@ works correctly with different file types, configurations, and scenarios.
 import os
 import sys
 import json
-from datetime import datetime
+import errno
+import threading
+from time import localtime, strftime, time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on descriptors generate_all() keeps open before closing a batch,
+# well below the common RLIMIT_NOFILE default of 1024
+_MAX_DEFERRED_FDS = 256
+
+# Code bodies shared by several test files
+_JS_HELLO = b"function hello() {\n    console.log('Hello, World!');\n}\n"
+_TS_USER = b"interface User {\n    name: string;\n    age: number;\n}\n"
+_AHK_F1 = b"F1::\n    MsgBox, Hello World!\nreturn\n"
+_PY_HELLO = b"def hello():\n    print('Hello, World!')\n"
+
+
+def _wrap(prefix, body, suffix=b""):
+    """Build test file content from a shared body and per-file prefix/suffix"""
+    return prefix + body + suffix
+
+
+# Test file definitions: (filename, encoded content, description)
+_JS_FILES = (
+    # Basic JS file without copyright
+    (
+        "basic.js",
+        _JS_HELLO,
+        "Basic JS without copyright notice"
+    ),
+
+    # JS file with existing copyright
+    (
+        "with_copyright.js",
+        _wrap(b"/**\n * Copyright (c) 2023 Test Company\n * All rights reserved.\n */\n\n", _JS_HELLO),
+        "JS with existing copyright notice"
+    ),
+
+    # JS file with different copyright format
+    (
+        "different_copyright.js",
+        _wrap(b"/* Copyright (c) 2023 Another Company */\n\n", _JS_HELLO),
+        "JS with different copyright format"
+    ),
+)
+
+_TS_FILES = (
+    # Basic TS file
+    (
+        "basic.ts",
+        _wrap(b"", _TS_USER, b"\nfunction greet(user: User): string {\n    return `Hello, ${user.name}!`;\n}\n"),
+        "Basic TypeScript without copyright notice"
+    ),
+
+    # TS file with existing copyright
+    (
+        "with_copyright.ts",
+        _wrap(b"/**\n * Copyright (c) 2023 TypeScript Company\n * Created: 2023-01-01 12:00:00\n * Last Updated: 2023-01-15 14:30:00\n */\n\n", _TS_USER),
+        "TypeScript with existing copyright and timestamps"
+    ),
+)
+
+_AHK_FILES = (
+    # Basic AHK file
+    (
+        "basic.ahk",
+        _wrap(b"", _AHK_F1, b"\nF2::\n    Send, Hello from AutoHotkey!\nreturn\n"),
+        "Basic AutoHotkey without copyright notice"
+    ),
+
+    # AHK2 file
+    (
+        "basic.ahk2",
+        b"F1:: {\n    MsgBox('Hello World!')\n}\n\nF2:: {\n    Send('Hello from AutoHotkey v2!')\n}\n",
+        "AutoHotkey v2 without copyright notice"
+    ),
+
+    # AHK file with existing copyright
+    (
+        "with_copyright.ahk",
+        _wrap(b"/*\n * Copyright (c) 2023 AHK Company\n * All rights reserved.\n */\n\n", _AHK_F1),
+        "AutoHotkey with existing copyright notice"
+    ),
+)
+
+_PY_FILES = (
+    # Basic Python file
+    (
+        "basic.py",
+        _wrap(b"", _PY_HELLO, b"\nif __name__ == '__main__':\n    hello()\n"),
+        "Basic Python without copyright notice"
+    ),
+
+    # Python file with existing copyright
+    (
+        "with_copyright.py",
+        _wrap(b"# Copyright (c) 2023 Python Company\n# All rights reserved.\n\n", _PY_HELLO),
+        "Python with existing copyright notice"
+    ),
+)
+
+_CPP_FILES = (
+    # Basic C++ file
+    (
+        "basic.cpp",
+        b"#include <iostream>\n\nint main() {\n    std::cout << \"Hello, World!\" << std::endl;\n    return 0;\n}\n",
+        "Basic C++ without copyright notice"
+    ),
+
+    # C++ header file
+    (
+        "basic.h",
+        b"#ifndef BASIC_H\n#define BASIC_H\n\nclass Basic {\npublic:\n    void hello();\n};\n\n#endif\n",
+        "Basic C++ header without copyright notice"
+    ),
+)
+
+_JSON_FILES = (
+    # Config file
+    (
+        "config.json",
+        b'{\n    "name": "test",\n    "version": "1.0.0",\n    "description": "Test configuration"\n}\n',
+        "JSON config file (should be excluded)"
+    ),
+
+    # Package file
+    (
+        "package.json",
+        b'{\n    "name": "test-package",\n    "version": "1.0.0",\n    "description": "Test package"\n}\n',
+        "JSON package file (should be excluded)"
+    ),
+)
+
+_MIXED_FILES = (
+    # HTML file
+    (
+        "basic.html",
+        b"<!DOCTYPE html>\n<html>\n<head>\n    <title>Test Page</title>\n</head>\n<body>\n    <h1>Hello World</h1>\n</body>\n</html>\n",
+        "Basic HTML without copyright notice"
+    ),
+
+    # CSS file
+    (
+        "basic.css",
+        b"body {\n    font-family: Arial, sans-serif;\n    margin: 0;\n    padding: 20px;\n}\n\nh1 {\n    color: #333;\n}\n",
+        "Basic CSS without copyright notice"
+    ),
+
+    # Shell script
+    (
+        "basic.sh",
+        b"#!/bin/bash\n\necho \"Hello, World!\"\n\nexit 0\n",
+        "Basic shell script without copyright notice"
+    ),
+)
+
 
 class TestFileGenerator:
-    def __init__(self, output_dir="test_files"):
+    def __init__(self, output_dir="test_files", verbose=True):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.verbose = verbose
+        
+        # Computed once; absolute() queries the working directory on every call
+        self.abs_output_dir = self.output_dir.absolute()
+        
+        # Output file paths are built by plain string concatenation on this prefix
+        self._prefix = os.fspath(self.output_dir) + os.sep
+        
+        # Timestamps only have second precision, so reuse the last formatted one
+        self._last_ts_sec = None
+        self._last_ts_str = ""
+        
+        self._file_count = 0
+        
+        # Set by generate_all(): create_files() submits writes to the pool and
+        # log output is journaled so it can be replayed once every write is done
+        self._executor = None
+        self._journal = None
         
-    def log(self, message):
-        """Print timestamped log message"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {message}")
+        # Set by generate_all() to defer closing written files to batches;
+        # pool threads append to it, so it is guarded by a lock
+        self._open_fds = None
+        self._fd_lock = threading.Lock()
+        
+    def log(self, message, force=False):
+        """Print timestamped log message (message may be a callable building it)"""
+        if not (self.verbose or force):
+            return
+        if self._journal is not None:
+            self._journal.append(("log", message))
+            return
+        if callable(message):
+            message = message()
+        now = int(time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = strftime("%Y-%m-%d %H:%M:%S", localtime(now))
+        sys.stdout.write(f"[{self._last_ts_str}] {message}\n")
+    
+    def log_separator(self):
+        """Print a blank line between log sections"""
+        if not self.verbose:
+            return
+        if self._journal is not None:
+            self._journal.append(("separator",))
+            return
+        sys.stdout.write("\n")
+    
+    def _write_bytes(self, filepath, data):
+        """Write encoded content with a single low-level open/write"""
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except BaseException:
+            os.close(fd)
+            raise
+        
+        with self._fd_lock:
+            if self._open_fds is None:
+                fds = [fd]
+            else:
+                self._open_fds.append(fd)
+                if len(self._open_fds) < _MAX_DEFERRED_FDS:
+                    return
+                fds, self._open_fds = self._open_fds, []
+        for fd in fds:
+            os.close(fd)
+    
+    def _close_open_files(self):
+        """Close every file descriptor deferred by _write_bytes()"""
+        with self._fd_lock:
+            fds, self._open_fds = self._open_fds, None
+        for fd in fds or ():
+            os.close(fd)
+    
+    def _sync_output_dir(self):
+        """Flush the output directory's metadata once for the whole batch"""
+        try:
+            dfd = os.open(self._prefix, os.O_RDONLY)
+        except OSError:
+            # Directories can't be opened this way on every platform (e.g. Windows)
+            return
+        try:
+            os.fsync(dfd)
+        except OSError as e:
+            # Only tolerate filesystems that don't support syncing a directory
+            if e.errno not in (errno.EINVAL, errno.EBADF):
+                raise
+        finally:
+            os.close(dfd)
     
     def create_file(self, filename, content, description=""):
         """Create a test file with given content"""
-        filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return self.create_files([(filename, content, description)])[0]
+    
+    def create_files(self, items):
+        """Create test files from a sequence of (filename, content, description) tuples"""
+        # Encode any text content before touching the filesystem
+        encoded = [(filename, content if isinstance(content, bytes) else content.encode('utf-8'), description)
+                   for filename, content, description in items]
         
-        self.log(f"✓ Created {filename} ({len(content)} chars) - {description}")
-        return filepath
+        paths = []
+        for filename, data, description in encoded:
+            filepath = self._prefix + filename
+            if self._executor is not None:
+                # Reported by _replay_journal() once the write has succeeded
+                future = self._executor.submit(self._write_bytes, filepath, data)
+                self._journal.append(("write", future, filename, data, description))
+            else:
+                self._write_bytes(filepath, data)
+                self._record_created(filename, data, description)
+            paths.append(filepath)
+        return paths
+    
+    def _record_created(self, filename, data, description):
+        """Count and log a file whose write has completed"""
+        self._file_count += 1
+        self.log(lambda: f"✓ Created {filename} ({len(data)} bytes) - {description}")
+    
+    def _replay_journal(self):
+        """Emit journaled log output in order, returning (phase, error) for failed writes"""
+        journal, self._journal = self._journal, None
+        errors = []
+        phase_name = None
+        for entry in journal or ():
+            kind = entry[0]
+            if kind == "phase":
+                phase_name = entry[1]
+            elif kind == "log":
+                self.log(entry[1])
+            elif kind == "separator":
+                self.log_separator()
+            else:
+                _, future, filename, data, description = entry
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append((phase_name, e))
+                else:
+                    self._record_created(filename, data, description)
+        return errors
     
     def generate_js_files(self):
         """Generate JavaScript test files"""
         self.log("Generating JavaScript test files...")
         
-        # Basic JS file without copyright
-        self.create_file(
-            "basic.js",
-            "function hello() {\n    console.log('Hello, World!');\n}\n",
-            "Basic JS without copyright notice"
-        )
-        
-        # JS file with existing copyright
-        self.create_file(
-            "with_copyright.js",
-            "/**\n * Copyright (c) 2023 Test Company\n * All rights reserved.\n */\n\nfunction hello() {\n    console.log('Hello, World!');\n}\n",
-            "JS with existing copyright notice"
-        )
-        
-        # JS file with different copyright format
-        self.create_file(
-            "different_copyright.js",
-            "/* Copyright (c) 2023 Another Company */\n\nfunction hello() {\n    console.log('Hello, World!');\n}\n",
-            "JS with different copyright format"
-        )
+        self.create_files(_JS_FILES)
     
     def generate_ts_files(self):
         """Generate TypeScript test files"""
         self.log("Generating TypeScript test files...")
         
-        # Basic TS file
-        self.create_file(
-            "basic.ts",
-            "interface User {\n    name: string;\n    age: number;\n}\n\nfunction greet(user: User): string {\n    return `Hello, ${user.name}!`;\n}\n",
-            "Basic TypeScript without copyright notice"
-        )
-        
-        # TS file with existing copyright
-        self.create_file(
-            "with_copyright.ts",
-            "/**\n * Copyright (c) 2023 TypeScript Company\n * Created: 2023-01-01 12:00:00\n * Last Updated: 2023-01-15 14:30:00\n */\n\ninterface User {\n    name: string;\n    age: number;\n}\n",
-            "TypeScript with existing copyright and timestamps"
-        )
+        self.create_files(_TS_FILES)
     
     def generate_ahk_files(self):
         """Generate AutoHotkey test files"""
         self.log("Generating AutoHotkey test files...")
         
-        # Basic AHK file
-        self.create_file(
-            "basic.ahk",
-            "F1::\n    MsgBox, Hello World!\nreturn\n\nF2::\n    Send, Hello from AutoHotkey!\nreturn\n",
-            "Basic AutoHotkey without copyright notice"
-        )
-        
-        # AHK2 file
-        self.create_file(
-            "basic.ahk2",
-            "F1:: {\n    MsgBox('Hello World!')\n}\n\nF2:: {\n    Send('Hello from AutoHotkey v2!')\n}\n",
-            "AutoHotkey v2 without copyright notice"
-        )
-        
-        # AHK file with existing copyright
-        self.create_file(
-            "with_copyright.ahk",
-            "/*\n * Copyright (c) 2023 AHK Company\n * All rights reserved.\n */\n\nF1::\n    MsgBox, Hello World!\nreturn\n",
-            "AutoHotkey with existing copyright notice"
-        )
+        self.create_files(_AHK_FILES)
     
     def generate_py_files(self):
         """Generate Python test files"""
         self.log("Generating Python test files...")
         
-        # Basic Python file
-        self.create_file(
-            "basic.py",
-            "def hello():\n    print('Hello, World!')\n\nif __name__ == '__main__':\n    hello()\n",
-            "Basic Python without copyright notice"
-        )
-        
-        # Python file with existing copyright
-        self.create_file(
-            "with_copyright.py",
-            "# Copyright (c) 2023 Python Company\n# All rights reserved.\n\ndef hello():\n    print('Hello, World!')\n",
-            "Python with existing copyright notice"
-        )
+        self.create_files(_PY_FILES)
     
     def generate_cpp_files(self):
         """Generate C++ test files"""
         self.log("Generating C++ test files...")
         
-        # Basic C++ file
-        self.create_file(
-            "basic.cpp",
-            "#include <iostream>\n\nint main() {\n    std::cout << \"Hello, World!\" << std::endl;\n    return 0;\n}\n",
-            "Basic C++ without copyright notice"
-        )
-        
-        # C++ header file
-        self.create_file(
-            "basic.h",
-            "#ifndef BASIC_H\n#define BASIC_H\n\nclass Basic {\npublic:\n    void hello();\n};\n\n#endif\n",
-            "Basic C++ header without copyright notice"
-        )
+        self.create_files(_CPP_FILES)
     
     def generate_json_files(self):
         """Generate JSON files (should be excluded)"""
         self.log("Generating JSON files (should be excluded)...")
         
-        # Config file
-        self.create_file(
-            "config.json",
-            '{\n    "name": "test",\n    "version": "1.0.0",\n    "description": "Test configuration"\n}\n',
-            "JSON config file (should be excluded)"
-        )
-        
-        # Package file
-        self.create_file(
-            "package.json",
-            '{\n    "name": "test-package",\n    "version": "1.0.0",\n    "description": "Test package"\n}\n',
-            "JSON package file (should be excluded)"
-        )
+        self.create_files(_JSON_FILES)
     
     def generate_mixed_files(self):
         """Generate files with mixed content"""
         self.log("Generating mixed content files...")
         
-        # HTML file
-        self.create_file(
-            "basic.html",
-            "<!DOCTYPE html>\n<html>\n<head>\n    <title>Test Page</title>\n</head>\n<body>\n    <h1>Hello World</h1>\n</body>\n</html>\n",
-            "Basic HTML without copyright notice"
-        )
-        
-        # CSS file
-        self.create_file(
-            "basic.css",
-            "body {\n    font-family: Arial, sans-serif;\n    margin: 0;\n    padding: 20px;\n}\n\nh1 {\n    color: #333;\n}\n",
-            "Basic CSS without copyright notice"
-        )
-        
-        # Shell script
-        self.create_file(
-            "basic.sh",
-            "#!/bin/bash\n\necho \"Hello, World!\"\n\nexit 0\n",
-            "Basic shell script without copyright notice"
-        )
+        self.create_files(_MIXED_FILES)
     
     def generate_vscode_settings(self):
         """Generate VS Code settings for testing"""
@@ -197,11 +380,18 @@ class TestFileGenerator:
             "copyright-notice.updateTimeFormat": "YYYY-MM-DD HH:mm:ss"
         }
         
-        settings_path = self.output_dir / "test_settings.json"
-        with open(settings_path, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
+        # orjson only supports 2-space indentation, so the stdlib fallback
+        # uses the same indent to keep the output byte-identical
+        if orjson is not None:
+            settings_content = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+        else:
+            settings_content = json.dumps(settings, indent=2).encode('utf-8')
         
-        self.log(f"✓ Created test_settings.json - VS Code settings for testing")
+        # Goes through the same write path as the other phases so it
+        # overlaps with them instead of being written afterwards
+        self.create_files([
+            ("test_settings.json", settings_content, "VS Code settings for testing")
+        ])
     
     def generate_readme(self):
         """Generate README for test files"""
@@ -262,62 +452,94 @@ This directory contains test files to verify the copyright notice extension work
 Use the provided `test_settings.json` file to configure the extension for testing.
 """
         
-        readme_path = self.output_dir / "README.md"
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        
-        self.log(f"✓ Created README.md - Testing instructions")
+        self.create_files([
+            ("README.md", readme_content, "Testing instructions")
+        ])
     
     def generate_all(self):
         """Generate all test files"""
         self.log("=== Starting Test File Generation ===")
-        self.log(f"Output directory: {self.output_dir.absolute()}")
-        print()
+        self.log(f"Output directory: {self.abs_output_dir}")
+        self.log_separator()
         
+        phases = [
+            self.generate_js_files,
+            self.generate_ts_files,
+            self.generate_ahk_files,
+            self.generate_py_files,
+            self.generate_cpp_files,
+            self.generate_json_files,
+            self.generate_mixed_files,
+            self.generate_vscode_settings,
+            self.generate_readme,
+        ]
+        errors = []
+        
+        # The summary reports only the files written by this run
+        self._file_count = 0
+        self._journal = []
+        self._open_fds = []
         try:
-            self.generate_js_files()
-            print()
-            self.generate_ts_files()
-            print()
-            self.generate_ahk_files()
-            print()
-            self.generate_py_files()
-            print()
-            self.generate_cpp_files()
-            print()
-            self.generate_json_files()
-            print()
-            self.generate_mixed_files()
-            print()
-            self.generate_vscode_settings()
-            print()
-            self.generate_readme()
-            print()
+            # Every phase submits its writes up front; leaving the block waits
+            # for all of them, so writes from different phases overlap
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                self._executor = executor
+                for phase in phases:
+                    self._journal.append(("phase", phase.__name__))
+                    try:
+                        phase()
+                    except Exception as e:
+                        errors.append((phase.__name__, e))
+                    self.log_separator()
+            
+            # Only writes that succeeded are reported as created
+            errors.extend(self._replay_journal())
             
-            # Count files
-            file_count = len(list(self.output_dir.glob("*")))
-            self.log(f"=== Test file generation completed ===")
-            self.log(f"Generated {file_count} files in {self.output_dir}")
-            self.log("Use these files to test the copyright notice extension!")
+            try:
+                self._close_open_files()
+                self._sync_output_dir()
+            except OSError as e:
+                errors.append(("sync output directory", e))
             
-        except Exception as e:
-            self.log(f"ERROR: Failed to generate test files: {e}")
-            return False
+            if errors:
+                for name, e in errors:
+                    self.log(f"ERROR: Failed to generate test files ({name}): {e}", force=True)
+            else:
+                self.log(f"=== Test file generation completed ===")
+                self.log(f"Generated {self._file_count} files in {self.output_dir}")
+                self.log("Use these files to test the copyright notice extension!")
         
-        return True
+        finally:
+            self._executor = None
+            self._journal = None
+            self._close_open_files()
+            sys.stdout.flush()
+        
+        return not errors
 
 def main():
     """Main function"""
-    if len(sys.argv) > 1:
-        output_dir = sys.argv[1]
+    # Block-buffer stdout so the log is emitted in a few large writes
+    # instead of one write per line; generate_all() flushes when done
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
+    args = sys.argv[1:]
+    verbose = True
+    if "-q" in args or "--quiet" in args:
+        verbose = False
+        args = [arg for arg in args if arg not in ("-q", "--quiet")]
+    
+    if len(args) > 0:
+        output_dir = args[0]
     else:
         output_dir = "test_files"
     
-    generator = TestFileGenerator(output_dir)
+    generator = TestFileGenerator(output_dir, verbose=verbose)
     success = generator.generate_all()
     
     if success:
-        print(f"\nTest files generated successfully in: {generator.output_dir.absolute()}")
+        print(f"\nTest files generated successfully in: {generator.abs_output_dir}")
         print("You can now use these files to test the copyright notice extension!")
     else:
         print("\nFailed to generate test files.")